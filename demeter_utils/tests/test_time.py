@@ -0,0 +1,53 @@
+from datetime import datetime
+
+from pandas import NaT, Series, Timedelta, Timestamp, date_range, to_datetime
+from pandas.testing import assert_index_equal, assert_series_equal
+from sure import expect
+
+from demeter_utils.time import convert_dt_to_unix
+
+EPOCH = Timestamp("2022-05-01 00:00:00.5")
+DT_INDEX = date_range(start="2022-04-01", periods=50, freq="7h", name="date")
+
+
+def _convert_dt_to_unix_timedelta(dt, relative_epoch):
+    return (to_datetime(dt) - to_datetime(relative_epoch)) // Timedelta("1s")
+
+
+class TestConvertDtToUnix:
+    def test_series(self):
+        dt = Series(DT_INDEX, index=range(10, 60), name="date")
+        assert_series_equal(
+            convert_dt_to_unix(dt, relative_epoch=EPOCH),
+            _convert_dt_to_unix_timedelta(dt, EPOCH),
+        )
+
+    def test_index(self):
+        assert_index_equal(
+            convert_dt_to_unix(DT_INDEX, relative_epoch=EPOCH),
+            _convert_dt_to_unix_timedelta(DT_INDEX, EPOCH),
+            exact=True,
+        )
+
+    def test_array(self):
+        dt = DT_INDEX.to_numpy().astype("datetime64[s]")
+        assert_index_equal(
+            convert_dt_to_unix(dt, relative_epoch=EPOCH),
+            _convert_dt_to_unix_timedelta(dt, EPOCH),
+            exact=True,
+        )
+
+    def test_series_with_nat(self):
+        dt = Series([datetime(2022, 4, 1), NaT, datetime(2022, 6, 1)])
+        assert_series_equal(
+            convert_dt_to_unix(dt, relative_epoch=EPOCH),
+            _convert_dt_to_unix_timedelta(dt, EPOCH),
+        )
+
+    def test_scalar(self):
+        expect(convert_dt_to_unix(datetime(1970, 1, 2))).to.equal(86400)
+        expect(
+            convert_dt_to_unix(
+                datetime(2022, 5, 1), relative_epoch=datetime(2022, 4, 30)
+            )
+        ).to.equal(86400)
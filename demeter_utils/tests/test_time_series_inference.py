@@ -0,0 +1,80 @@
+from datetime import datetime, timedelta
+
+from numpy import nan
+from pandas import DataFrame, Series, date_range, to_datetime
+from pandas.testing import assert_series_equal
+from sure import expect
+
+from demeter_utils.time_series.inference import TimeSeriesFitter, get_df_skeleton
+
+
+class TestRecalibrateDatetimeSkeleton:
+    def test_unmatched_row_tied_with_observed_row_is_split(self):
+        """An unmatched proposed row on the same datetime as an observed row is evenly split into the following gap."""
+        df_true = DataFrame(
+            data={
+                "date": to_datetime(
+                    [
+                        "2021-12-31",
+                        "2022-01-07",
+                        "2022-01-08",
+                        "2022-01-22",
+                        "2022-01-24",
+                        "2022-01-28",
+                    ]
+                ),
+                "value": [0.1, 0.2, 0.3, 0.4, 0.5, 0.6],
+            }
+        )
+        df_skeleton = get_df_skeleton(
+            df_true=df_true,
+            datetime_start=datetime(2022, 1, 1),
+            datetime_end=datetime(2022, 1, 31),
+            temporal_resolution_min=timedelta(days=3),
+            col_datetime="date",
+            col_value="value",
+            tolerance_alpha=1,
+        )
+        assert_series_equal(
+            df_skeleton["datetime_skeleton"],
+            Series(
+                to_datetime(
+                    [
+                        "2021-12-31",
+                        "2022-01-07",
+                        "2022-01-07T12:00",  # unmatched; proposed 01-07 (same as the observed 01-07)
+                        "2022-01-08",
+                        "2022-01-12T16:00",
+                        "2022-01-17T08:00",
+                        "2022-01-22",
+                        "2022-01-23",  # unmatched; proposed 01-22 (same as the observed 01-22)
+                        "2022-01-24",
+                        "2022-01-28",
+                        "2022-01-31",
+                    ],
+                    format="ISO8601",
+                ),
+                name="datetime_skeleton",
+            ),
+            check_index=False,
+        )
+        expect(df_skeleton["within_tolerance"].tolist()).to.equal(
+            [True, True, False, True, False, False, True, False, True, True, False]
+        )
+
+
+class TestDoubleLogistic:
+    def test_no_values_near_max_raise(self):
+        df = DataFrame(
+            data={
+                "date": date_range(start="2022-05-01", periods=12, freq="7D"),
+                "ndvi": [nan] * 12,
+                "source": ["drone"] * 12,
+            }
+        )
+        fitter = TimeSeriesFitter(
+            df=df, step_size=timedelta(days=1), window_size=timedelta(days=10)
+        )
+        fitter.double_logistic.when.called_with().should.throw(
+            ValueError, "No smoothed values are within 10% of the maximum value"
+        )
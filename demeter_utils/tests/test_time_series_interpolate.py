@@ -0,0 +1,81 @@
+from datetime import timedelta
+
+from numpy import isfinite
+from numpy.random import default_rng
+from numpy.testing import assert_allclose
+from pandas import Series, Timedelta, Timestamp, date_range, to_datetime, to_timedelta
+from sure import expect
+
+from demeter_utils.time_series.interpolate import weighted_moving_average
+
+T_DENSE = Series(date_range(start="2022-04-01", periods=40, freq="3D"))
+Y_DENSE = Series([0.2 + 0.6 * (i % 13) / 12 for i in range(40)])
+
+# two clusters of observations separated by a gap much wider than 3 standard deviations of the kernel
+T_GAP = Series(to_datetime(["2022-05-01", "2022-05-02", "2022-06-10", "2022-06-11"]))
+Y_GAP = Series([0.3, 0.35, 0.7, 0.75])
+
+
+class TestWeightedMovingAverageTruncation:
+    def test_truncated_matches_full_kernel(self):
+        # weights beyond 6 standard deviations are < 1e-7 of the peak
+        kwargs = dict(
+            t=T_DENSE,
+            y=Y_DENSE,
+            step_size=timedelta(days=5),
+            window_size=timedelta(days=8),
+        )
+        df_full = weighted_moving_average(**kwargs)
+        df_truncated = weighted_moving_average(**kwargs, kernel_truncation=6)
+        df_truncated["date"].equals(df_full["date"]).should.be.true
+        assert_allclose(df_truncated["ndvi"], df_full["ndvi"], rtol=0, atol=1e-6)
+
+    def test_truncated_with_gap(self):
+        kwargs = dict(
+            t=T_GAP,
+            y=Y_GAP,
+            step_size=timedelta(days=7),
+            window_size=timedelta(days=10),
+        )
+        df_full = weighted_moving_average(**kwargs)
+        df_truncated = weighted_moving_average(**kwargs, kernel_truncation=3)
+        expect(len(df_truncated)).to.equal(len(df_full))
+        isfinite(df_truncated["ndvi"]).all().should.be.true
+
+        # bins with no observations within 3 standard deviations fall back to the full kernel
+        t_unix = (T_GAP - T_GAP.min()) / Timedelta("1s")
+        bins_unix = (df_full["date"] - T_GAP.min()) / Timedelta("1s")
+        sigma = (timedelta(days=10) / Timedelta("1s")) / 2
+        in_gap = [((t_unix - b).abs() > 3 * sigma).all() for b in bins_unix]
+        any(in_gap).should.be.true
+        assert_allclose(
+            df_truncated.loc[in_gap, "ndvi"], df_full.loc[in_gap, "ndvi"], rtol=1e-12
+        )
+
+    def test_truncated_with_random_sparse_series(self):
+        rng = default_rng(42)
+        for _ in range(50):
+            n = int(rng.integers(2, 8))
+            days = rng.choice(180, size=n, replace=False)
+            t = Series(Timestamp("2022-04-01") + to_timedelta(days, unit="D"))
+            y = Series(rng.uniform(0.1, 0.9, size=n))
+            kwargs = dict(
+                t=t.sort_values(ignore_index=True),
+                y=y,
+                step_size=timedelta(days=7),
+                window_size=timedelta(days=10),
+            )
+            df_full = weighted_moving_average(**kwargs)
+            df_truncated = weighted_moving_average(**kwargs, kernel_truncation=3)
+            expect(len(df_truncated)).to.equal(len(df_full))
+            isfinite(df_truncated["ndvi"]).all().should.be.true
+
+    def test_zero_weights_raise(self):
+        weighted_moving_average.when.called_with(
+            t=T_GAP,
+            y=Y_GAP,
+            step_size=timedelta(days=7),
+            window_size=timedelta(days=10),
+            weights=Series([0.0] * len(T_GAP)),
+            kernel_truncation=3,
+        ).should.throw(ZeroDivisionError)
@@ -0,0 +1,98 @@
+from datetime import datetime
+
+from demeter.data import (
+    Field,
+    Organization,
+    insertOrGetField,
+    insertOrGetGeom,
+    insertOrGetOrganization,
+)
+from numpy import int64
+from pandas import read_sql_query
+from shapely.geometry import Point
+from sqlalchemy.sql import text
+from sure import expect
+
+from demeter_utils.update import update_details, update_details_bulk
+
+TEST_ORGANIZATION = Organization(name="Test Organization")
+
+
+def _insert_fields(cursor, n_fields: int) -> list:
+    organization_id = insertOrGetOrganization(cursor, TEST_ORGANIZATION)
+    field_ids = []
+    for i in range(n_fields):
+        geom_id = insertOrGetGeom(cursor, Point(0, i))
+        field = Field(
+            name=f"Test Field {i}",
+            organization_id=organization_id,
+            geom_id=geom_id,
+            date_start=datetime(2022, 1, 1),
+        )
+        field_ids.append(insertOrGetField(cursor, field))
+    return field_ids
+
+
+def _read_field_details(conn) -> dict:
+    sql = text(
+        """
+        select field_id, details from field
+        """
+    )
+    df = read_sql_query(sql, conn)
+    return dict(zip(df["field_id"], df["details"]))
+
+
+class TestUpdateDetails:
+    """
+    Note: After all the tests in TestUpdateDetails run, `test_db_class` will clear all data since it has "class" scope.
+    """
+
+    def test_update_details(self, test_db_class):
+        with test_db_class.connect() as conn:
+            with conn.begin():
+                field_id = _insert_fields(conn.connection.cursor(), n_fields=1)[0]
+                update_details(
+                    conn.connection.cursor(),
+                    Field,
+                    int64(field_id),
+                    {"crop": "corn"},
+                )
+                details = _read_field_details(conn)
+                expect(details[field_id]).to.equal({"crop": "corn"})
+
+    def test_update_details_bulk(self, test_db_class):
+        with test_db_class.connect() as conn:
+            with conn.begin():
+                field_ids = _insert_fields(conn.connection.cursor(), n_fields=5)
+                # numpy integer IDs (e.g., from a DataFrame), split across several pages
+                id_details_pairs = [
+                    (int64(field_id), {"crop": "corn", "rank": i})
+                    for i, field_id in enumerate(field_ids)
+                ]
+                update_details_bulk(
+                    conn.connection.cursor(), Field, id_details_pairs, page_size=2
+                )
+                details = _read_field_details(conn)
+                for i, field_id in enumerate(field_ids):
+                    expect(details[field_id]).to.equal({"crop": "corn", "rank": i})
+
+    def test_update_details_bulk_only_updates_given_ids(self, test_db_class):
+        with test_db_class.connect() as conn:
+            with conn.begin():
+                field_ids = _insert_fields(conn.connection.cursor(), n_fields=2)
+                details_before = _read_field_details(conn)
+                update_details_bulk(
+                    conn.connection.cursor(), Field, [(field_ids[0], {"crop": "soy"})]
+                )
+                details = _read_field_details(conn)
+                expect(details[field_ids[0]]).to.equal({"crop": "soy"})
+                expect(details[field_ids[1]]).to.equal(details_before[field_ids[1]])
+
+    def test_update_details_bulk_empty(self, test_db_class):
+        with test_db_class.connect() as conn:
+            with conn.begin():
+                _insert_fields(conn.connection.cursor(), n_fields=1)
+                details_before = _read_field_details(conn)
+                update_details_bulk(conn.connection.cursor(), Field, [])
+                expect(_read_field_details(conn)).to.equal(details_before)
@@ -1,6 +1,8 @@
 from datetime import datetime, tzinfo
 
-from pandas import NA, Timedelta, isna, to_datetime
+from numpy import asarray, ndarray
+from pandas import NA, Index, Series, Timedelta, Timestamp, isna, to_datetime
+from pandas.api.types import is_datetime64_dtype
 
 
 def make_date_tzaware(d: datetime, tz: tzinfo) -> datetime:
@@ -34,7 +36,21 @@ def convert_dt_to_unix(
             (i.e., t = 0) for dt conversion; defaults to 1970-01-01 (or
             datetime.utcfromtimestamp(0)) which is the canonical Unix epoch.
     """
-    return (to_datetime(dt) - to_datetime(relative_epoch)) // Timedelta("1s")
+    epoch = to_datetime(relative_epoch)
+    if (
+        isinstance(dt, (ndarray, Index, Series))
+        and is_datetime64_dtype(dt)
+        and isinstance(epoch, Timestamp)
+        and epoch.tz is None
+        and not isna(dt).any()
+    ):
+        # tz-naive datetime64 arrays without NaT: a single subtraction on the int64 (nanosecond) values
+        dt_ns = asarray(dt).astype("datetime64[ns]").view("int64")
+        unix = (dt_ns - epoch.value) // 10**9
+        if isinstance(dt, Series):
+            return Series(unix, index=dt.index, name=dt.name)
+        return Index(unix, name=getattr(dt, "name", None))
+    return (to_datetime(dt) - epoch) // Timedelta("1s")
 
 
 def convert_unix_to_dt(
@@ -1,8 +1,22 @@
 from typing import Callable, Iterable, Union
 
-from numpy import arange, array, exp, polyfit
+from numpy import (
+    arange,
+    array,
+    clip,
+    empty,
+    exp,
+    multiply,
+    ndarray,
+    polyfit,
+    reciprocal,
+    subtract,
+)
 from pandas import DataFrame, Series
 
+# exponent beyond which a logistic term is treated as saturated when fitting (see `_logistic_into()`)
+_LOGISTIC_EXPONENT_LIMIT = 50.0
+
 
 def _cubic_poly_predict(coef: array, t: float) -> float:
     """Estimates f(t) where f is a fitted cubic polynomial with coefficients `coef`."""
@@ -78,3 +92,74 @@ def double_logistic(
     fraction2 = 1.0 / (1 + exp(-rate_incr * (t - t_incr)))
     y = ymin + ((ymax - ymin) * (fraction1 - fraction2))
     return y
+
+
+def _logistic_into(t: ndarray, rate: float, t_mid: float, out: ndarray) -> ndarray:
+    """Evaluates the logistic term `1 / (1 + exp(-rate * (t - t_mid)))` of `double_logistic()` in place in `out`.
+
+    The exponent is clipped to +/-`_LOGISTIC_EXPONENT_LIMIT`, beyond which the term is saturated (0 or 1) to well
+    within the precision of the fit, so `exp()` never overflows while the optimizer explores steep rates.
+    """
+    subtract(t, t_mid, out=out)
+    multiply(out, -rate, out=out)
+    clip(out, -_LOGISTIC_EXPONENT_LIMIT, _LOGISTIC_EXPONENT_LIMIT, out=out)
+    exp(out, out=out)
+    out += 1
+    return reciprocal(out, out=out)
+
+
+def _double_logistic_residuals(
+    p: ndarray, t: ndarray, y: ndarray, scratch: ndarray = None
+) -> ndarray:
+    """Residuals of `double_logistic()` against `y` (e.g., for `scipy.optimize.least_squares()`).
+
+    Args:
+        p (ndarray): Parameters in the order `ymin`, `ymax`, `t_incr`, `t_decr`, `rate_incr`, `rate_decr`.
+        t (ndarray): Scaled time values.
+        y (ndarray): Observed values at `t`.
+        scratch (ndarray, optional): Work array of shape (2, len(`t`)) for the logistic terms; pass the same array on
+            every call (e.g., via `least_squares(..., args=(t, y, scratch))`) to avoid reallocating it.
+    """
+    ymin, ymax, t_incr, t_decr, rate_incr, rate_decr = p
+    if scratch is None:
+        scratch = empty((2, len(t)))
+    fraction1 = _logistic_into(t, rate_decr, t_decr, out=scratch[0])
+    fraction2 = _logistic_into(t, rate_incr, t_incr, out=scratch[1])
+
+    resid = subtract(fraction1, fraction2)
+    resid *= ymax - ymin
+    resid += ymin
+    resid -= y
+    return resid
+
+
+def _double_logistic_jacobian(
+    p: ndarray, t: ndarray, y: ndarray, scratch: ndarray = None
+) -> ndarray:
+    """Jacobian (len(`t`) x 6) of `_double_logistic_residuals()` with respect to `p` (see its args)."""
+    ymin, ymax, t_incr, t_decr, rate_incr, rate_decr = p
+    y_range = ymax - ymin
+    if scratch is None:
+        scratch = empty((2, len(t)))
+    fraction1 = _logistic_into(t, rate_decr, t_decr, out=scratch[0])
+    fraction2 = _logistic_into(t, rate_incr, t_incr, out=scratch[1])
+
+    jac = empty((6, len(t)))
+    diff = subtract(fraction1, fraction2, out=jac[1])
+    subtract(1, diff, out=jac[0])
+
+    # derivatives of each logistic term with respect to its own exponent (overwriting the terms themselves)
+    subtract(1, fraction1, out=jac[3])
+    dfraction1 = multiply(
+        multiply(fraction1, y_range, out=fraction1), jac[3], out=fraction1
+    )
+    subtract(1, fraction2, out=jac[2])
+    dfraction2 = multiply(
+        multiply(fraction2, y_range, out=fraction2), jac[2], out=fraction2
+    )
+
+    multiply(dfraction2, rate_incr, out=jac[2])
+    multiply(dfraction1, -rate_decr, out=jac[3])
+    multiply(subtract(t_incr, t, out=jac[4]), dfraction2, out=jac[4])
+    multiply(subtract(t, t_decr, out=jac[5]), dfraction1, out=jac[5])
+    return jac.T
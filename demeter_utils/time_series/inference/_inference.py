@@ -1,18 +1,24 @@
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from functools import cached_property, partial
-from typing import Callable
+from typing import Callable, Optional
 
-from pandas import DataFrame
-from scipy.interpolate import UnivariateSpline
-from scipy.optimize import minimize
+from numpy import asarray, empty, float64
+from pandas import DataFrame, Series, Timedelta
+from scipy.interpolate import InterpolatedUnivariateSpline, UnivariateSpline
+from scipy.optimize import least_squares
 
 from demeter_utils.time import convert_dt_to_unix
 from demeter_utils.time_series.inference._double_logistic import (
+    _double_logistic_jacobian,
+    _double_logistic_residuals,
     approximate_inflection_with_cubic_poly,
     double_logistic,
 )
-from demeter_utils.time_series.interpolate import weighted_moving_average
+from demeter_utils.time_series.interpolate import (
+    assign_group_weights,
+    weighted_moving_average,
+)
 
 
 @dataclass
@@ -58,6 +64,12 @@ class TimeSeriesFitter:
     col_datetime: str = field(default="date")
     col_mapping_group: str = field(default="source")
     col_value: str = field(default="ndvi")
+    _splines: dict[float, UnivariateSpline] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _double_logistic_fit: Optional[tuple[float, float, dict[str, float]]] = field(
+        default=None, init=False, repr=False
+    )
 
     @cached_property
     def df_daily_weighted_moving_avg(
@@ -69,11 +81,16 @@ class TimeSeriesFitter:
         Returns:
             STAC_crop: Response from the titiler stac statistics endpoint.
         """
-        self.df.sort_values(by=[self.col_datetime], inplace=True)
-        wts = self.df[self.col_mapping_group].map(self.wt_mapping)
+        # only sort (without modifying `self.df`) if not already in chronological order
+        if self.df[self.col_datetime].is_monotonic_increasing:
+            df = self.df
+        else:
+            df = self.df.sort_values(by=[self.col_datetime], kind="mergesort")
+
+        wts = assign_group_weights(df[self.col_mapping_group], self.wt_mapping)
         return weighted_moving_average(
-            t=self.df[self.col_datetime],
-            y=self.df[self.col_value],
+            t=df[self.col_datetime],
+            y=df[self.col_value],
             step_size=self.step_size,
             window_size=self.window_size,
             weights=wts,
@@ -82,6 +99,14 @@ class TimeSeriesFitter:
             col_value=self.col_value,
         )
 
+    @cached_property
+    def _unix_daily_weighted_moving_avg(self) -> Series:
+        """Relative unix time (i.e., since the first time point) of `df_daily_weighted_moving_avg`."""
+        return convert_dt_to_unix(
+            self.df_daily_weighted_moving_avg[self.col_datetime],
+            relative_epoch=self.df_daily_weighted_moving_avg[self.col_datetime].min(),
+        )
+
     def cubic_spline(
         self, s: float = None, callable_unit_datetime: bool = True
     ) -> Callable:
@@ -91,7 +116,9 @@ class TimeSeriesFitter:
         See https://docs.scipy.org/doc/scipy/reference/generated/scipy.interpolate.UnivariateSpline.html
 
         Args:
-            s (float, optional): The smooting factor. Defaults to 5% of the mean data value if not specified.
+            s (float, optional): The smooting factor. Defaults to 5% of the mean data value if not specified. If 0, an
+                interpolating spline is fit (i.e., passes through all of the smoothed data values). Fitted splines are
+                cached for each value of `s`.
 
             callable_unit_datetime (bool, optional): If True, the returned function takes a `datetime` value as an arg;
                 if false, it takes a relative epoch value (i.e., `int` dtype). Defaults to True.
@@ -105,27 +132,25 @@ class TimeSeriesFitter:
         # Let's use 5% of mean value if not specified by user
         s = self.df[self.col_value].mean() * 0.05 if s is None else s
 
-        # UnivariateSpline must take `int`` dtype (i.e., unix) for `x`
-        xt = convert_dt_to_unix(
-            self.df_daily_weighted_moving_avg[self.col_datetime],
-            relative_epoch=self.df_daily_weighted_moving_avg[self.col_datetime].min(),
-        )
+        if s not in self._splines:
+            # UnivariateSpline must take `int`` dtype (i.e., unix) for `x`
+            xt = self._unix_daily_weighted_moving_avg
+            y = self.df_daily_weighted_moving_avg[self.col_value]
 
-        # Fit cubic spline to smoothed weighted mean curve data
-        get_value_from_relative_epoch_fx = UnivariateSpline(
-            x=xt, y=self.df_daily_weighted_moving_avg[self.col_value], k=3, s=s
-        )
+            # Fit cubic spline to smoothed weighted mean curve data
+            if s == 0:
+                # skips the search for knots that satisfy the smoothing condition
+                self._splines[s] = InterpolatedUnivariateSpline(x=xt, y=y, k=3)
+            else:
+                self._splines[s] = UnivariateSpline(x=xt, y=y, k=3, s=s)
+        get_value_from_relative_epoch_fx = self._splines[s]
 
         # Return the callable
         if callable_unit_datetime:
+            epoch = self.df_daily_weighted_moving_avg[self.col_datetime].min()
 
             def get_value_from_datetime(dt: datetime) -> float:
-                t = convert_dt_to_unix(
-                    dt,
-                    relative_epoch=self.df_daily_weighted_moving_avg[
-                        self.col_datetime
-                    ].min(),
-                )
+                t = convert_dt_to_unix(dt, relative_epoch=epoch)
                 return get_value_from_relative_epoch_fx(t)
 
             return get_value_from_datetime
@@ -150,14 +175,13 @@ class TimeSeriesFitter:
         # else:
         #     df_timeseries = self.df.copy()
 
+        epoch = self.df_daily_weighted_moving_avg[self.col_datetime].min()
+
         # Define the datetime to unix conversion to embed into get_value_from_datetime()
         def dt_transformation(dt: datetime) -> float:
             """Transform and standardize temporal dimension to improve convergence."""
             unix = convert_dt_to_unix(
-                dt,
-                relative_epoch=self.df_daily_weighted_moving_avg[
-                    self.col_datetime
-                ].min(),
+                dt, relative_epoch=epoch
             )  # convert to psuedo-unix
             return (unix - t_mean) / t_sd  # scale
 
@@ -166,21 +190,30 @@ class TimeSeriesFitter:
             # Determine left and right side of curve
             max_threshold = 0.1
             max_bound = y.max() * (1 - max_threshold)
-            ind_max = self.df_daily_weighted_moving_avg.loc[
-                self.df_daily_weighted_moving_avg[self.col_value] >= max_bound
-            ].index.values
+            # first and last positions at or above `max_bound`
+            near_max = (
+                self.df_daily_weighted_moving_avg[self.col_value].to_numpy()
+                >= max_bound
+            )
+            if not near_max.any():
+                raise ValueError(
+                    f"No smoothed values are within {max_threshold:.0%} of the maximum value ({y.max()}); "
+                    "cannot guess starting parameters for the double logistic fit."
+                )
+            idx_first_max = near_max.argmax()
+            idx_last_max = len(near_max) - 1 - near_max[::-1].argmax()
 
             # Approximate inflection points
-            df_left = self.df_daily_weighted_moving_avg.iloc[: min(ind_max) + 1, :]
+            df_left = self.df_daily_weighted_moving_avg.iloc[: idx_first_max + 1, :]
             left_params = approximate_inflection_with_cubic_poly(
-                t=df_left[self.col_datetime].apply(lambda dt: dt_transformation(dt)),
+                t=dt_transformation(df_left[self.col_datetime]),
                 y=df_left[self.col_value],
                 ymin=y.min(),
                 ymax=y.max(),
             )
-            df_right = self.df_daily_weighted_moving_avg.iloc[max(ind_max) :, :]
+            df_right = self.df_daily_weighted_moving_avg.iloc[idx_last_max:, :]
             right_params = approximate_inflection_with_cubic_poly(
-                t=df_right[self.col_datetime].apply(lambda dt: dt_transformation(dt)),
+                t=dt_transformation(df_right[self.col_datetime]),
                 y=df_right[self.col_value],
                 ymin=y.min(),
                 ymax=y.max(),
@@ -195,48 +228,44 @@ class TimeSeriesFitter:
             }
             return guess
 
-        # Define cost function
-        def _cost_function(p, t, y):
-            partial_fx = partial(
-                double_logistic,
-                ymin=p[0],
-                ymax=p[1],
-                t_incr=p[2],
-                t_decr=p[3],
-                rate_incr=p[4],
-                rate_decr=p[5],
+        # The fit (time scaling and fitted parameters) is cached, so repeated calls only rebuild the callable
+        if self._double_logistic_fit is None:
+            # Standardize to reduce scale (mean = 0, sd = 1)
+            date_min = self.df[self.col_datetime].min()
+            s_unix = (self.df[self.col_datetime] - date_min) // Timedelta("1s")
+            t_mean = s_unix.mean()
+            t_sd = s_unix.std()
+
+            # Partial double logistic function must take scaled `float` dtype for `t`
+            t = dt_transformation(self.df_daily_weighted_moving_avg[self.col_datetime])
+            y = self.df_daily_weighted_moving_avg[self.col_value].astype(float)
+
+            guess_values = [*_guess_starting_params().values()]
+
+            # Fit by nonlinear least squares (trust region reflective, with the analytic Jacobian) from initial values;
+            # `t` and `y` are passed as float64 ndarrays (with a reused work array) to avoid overhead on every evaluation
+            t_values = asarray(t, dtype=float64)
+            y_values = asarray(y, dtype=float64)
+            scratch = empty((2, len(t_values)))
+            opt = least_squares(
+                _double_logistic_residuals,
+                guess_values,
+                jac=_double_logistic_jacobian,
+                args=(t_values, y_values, scratch),
+                method="trf",
+                x_scale="jac",
             )
-            y_pred = partial_fx(t)
-            se = (y_pred - y) ** 2
-            return se.sum()
-
-        # Standardize to reduce scale (mean = 0, sd = 1)
-        date_min = self.df[self.col_datetime].min()
-        s_unix = self.df[self.col_datetime].map(
-            lambda dt: convert_dt_to_unix(dt, relative_epoch=date_min)
-        )
-        t_mean = s_unix.mean()
-        t_sd = s_unix.std()
-
-        # Partial double logistic function must take scaled `float` dtype for `t`
-        t = self.df_daily_weighted_moving_avg[self.col_datetime].apply(
-            lambda dt: dt_transformation(dt)
-        )
-        y = self.df_daily_weighted_moving_avg[self.col_value].astype(float)
-
-        guess_values = [*_guess_starting_params().values()]
-
-        # Minimize cost function with initial values
-        opt = minimize(_cost_function, guess_values, args=(t, y))
-        popt = opt.x
-        pars = {
-            "ymin": popt[0],
-            "ymax": popt[1],
-            "t_incr": popt[2],
-            "t_decr": popt[3],
-            "rate_incr": popt[4],
-            "rate_decr": popt[5],
-        }
+            popt = opt.x
+            pars = {
+                "ymin": popt[0],
+                "ymax": popt[1],
+                "t_incr": popt[2],
+                "t_decr": popt[3],
+                "rate_incr": popt[4],
+                "rate_decr": popt[5],
+            }
+            self._double_logistic_fit = (t_mean, t_sd, pars)
+        t_mean, t_sd, pars = self._double_logistic_fit
 
         # TODO: Figure out how to attach the `pars` dict to the returned function (e.g., as a class object)
         get_value_from_relative_epoch_fx = partial(
@@ -253,15 +282,6 @@ class TimeSeriesFitter:
         if callable_unit_datetime:
             # Create partial function that takes `datetime`, transforms it appropriately, and estimates value
             def get_value_from_datetime(dt: datetime) -> float:
-                get_value_from_relative_epoch_fx = partial(
-                    double_logistic,
-                    ymin=pars["ymin"],
-                    ymax=pars["ymax"],
-                    t_incr=pars["t_incr"],
-                    t_decr=pars["t_decr"],
-                    rate_incr=pars["rate_incr"],
-                    rate_decr=pars["rate_decr"],
-                )
                 return get_value_from_relative_epoch_fx(dt_transformation(dt))
 
             return get_value_from_datetime
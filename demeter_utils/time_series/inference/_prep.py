@@ -1,10 +1,9 @@
 from datetime import datetime, timedelta
 
-from numpy import ceil
-from numpy import nan as np_nan
-from pandas import DataFrame, NaT, Timedelta
+from numpy import argsort, ceil, iinfo, int64, maximum, minimum, where
+from pandas import DataFrame, DatetimeIndex, NaT, RangeIndex, Timedelta
 from pandas import concat as pd_concat
-from pandas import merge_asof
+from pandas import date_range, merge_asof
 
 from demeter_utils.time_series.inference._utils import (
     _get_df_skeleton_row_template,
@@ -23,15 +22,14 @@ def _add_missing_rows(
     datetime_end: datetime,
 ) -> DataFrame:
     """Add the rows from `df` that were not included in `df_merged` (unless outside desired date range)."""
-    # Add rows...
-    idx_missing = ~df[col_datetime].isin(df_merged[col_datetime])
-    df_missing = df.loc[idx_missing][[col_datetime, col_value]]
-    df_missing.insert(0, "datetime_proposed", NaT)
-
-    # ...unless they are outside of the desired date range
+    # Add rows unless they are outside of the desired date range
     tolerance = tolerance_alpha * temporal_resolution_min
-    df_missing = df_missing.loc[df_missing[col_datetime] >= datetime_start - tolerance]
-    df_missing = df_missing.loc[df_missing[col_datetime] <= datetime_end + tolerance]
+    dt = df[col_datetime]
+    idx_missing = ~dt.isin(df_merged[col_datetime].values) & dt.between(
+        datetime_start - tolerance, datetime_end + tolerance, inclusive="both"
+    )
+    df_missing = df.loc[idx_missing, [col_datetime, col_value]]
+    df_missing.insert(0, "datetime_proposed", NaT)
     return pd_concat([df_merged, df_missing], axis=0, ignore_index=True)
 
 
@@ -42,16 +40,17 @@ def _create_df_proposed(
     # determine "length_out" based on temporal resolution
     length_out = int(ceil((datetime_end - datetime_start) / temporal_resolution_min))
 
-    # create an empty dataframe `df_proposed` and outline the time windows that need to be represented
-    df_proposed = DataFrame(data=[], columns=["within_tolerance"])
-    list_rq_datetime = [
-        datetime_start + (temporal_resolution_min * x) for x in range(length_out + 1)
-    ]
+    # outline the time windows that need to be represented
+    rq_datetime = date_range(
+        start=datetime_start, periods=length_out + 1, freq=temporal_resolution_min
+    )
     # ensure last value of rq_datetime is datetime_end
-    list_rq_datetime[-1] = datetime_end
+    rq_datetime = rq_datetime[:-1].append(DatetimeIndex([datetime_end]))
 
-    df_proposed["datetime_proposed"] = list_rq_datetime
-    df_proposed["within_tolerance"] = False
+    df_proposed = DataFrame(
+        data={"within_tolerance": False, "datetime_proposed": rq_datetime},
+        index=RangeIndex(len(rq_datetime)),
+    )
     return df_proposed
 
 
@@ -63,55 +62,40 @@ def _map_observed_datetimes(
     df.loc[df[col_value].notna(), "within_tolerance"] = True
     # create column `datetime_skeleton` whose values are the same as `col_datetime`
     # where `within_tolerance`=True and otherwise, are the same as `datetime_proposed`
-    df["datetime_skeleton"] = df.apply(
-        lambda row: row[col_datetime]
-        if row["within_tolerance"] is True
-        else row["datetime_proposed"],
-        axis=1,
+    df["datetime_skeleton"] = where(
+        df["within_tolerance"].eq(True).to_numpy(),
+        df[col_datetime].to_numpy(dtype="datetime64[ns]"),
+        df["datetime_proposed"].to_numpy(dtype="datetime64[ns]"),
     )
     row_template = _get_df_skeleton_row_template(col_value)
     cols_keep = list(row_template.keys())
-    return df.sort_values(by="datetime_skeleton").reset_index(drop=False)[cols_keep]
+    # stable argsort on the raw datetime64 values (NaT sorts last, as with `sort_values()`)
+    order = argsort(
+        df["datetime_skeleton"].to_numpy(dtype="datetime64[ns]"), kind="stable"
+    )
+    return df.iloc[order].reset_index(drop=True)[cols_keep]
 
 
 def _ensure_full_temporal_extent(
     df: DataFrame, col_value: str, datetime_start: datetime, datetime_end: datetime
 ):
     """Ensure the full time range is covered."""
-    df_out = df.copy()
     row_template = _get_df_skeleton_row_template(col_value)
+    list_df = [df]
     if df["datetime_skeleton"].min() > datetime_start:
         first_row = row_template.copy()
         first_row["datetime_skeleton"] = [datetime_start]
-        df_out = pd_concat([DataFrame(first_row), df_out], axis=0)
+        list_df.insert(0, DataFrame(first_row))
 
     if df["datetime_skeleton"].max() < datetime_end:
         last_row = row_template.copy()
         last_row["datetime_skeleton"] = [datetime_end]
-        df_out = pd_concat([df_out, DataFrame(last_row)], axis=0)
-    return df_out
-
-
-def _recalibrate_date_split(
-    datetime_pre: datetime,
-    datetime_post: datetime,
-    n_dates_split: int,
-    idx: int,
-) -> datetime:
-    """
-    Gets `idx` of `n_dates_split` evenly-spaced split points between `datetime_pre` and `datetime_post`.
+        list_df.append(DataFrame(last_row))
 
-    Args:
-         datetime_pre (datetime): Lower bound of the date range to be split.
-         datetime_post (datetime): Upper bound of the date range to be split.
-         n_dates_split (int): Number of evenly-spaced split points within date range.
-         idx (int): Indicates which split index (starting from 1) should be returned.
-    """
-    datetime_delta = (datetime_post - datetime_pre) / (n_dates_split + 1)
-    list_recalibrated_splits = [
-        datetime_pre + (datetime_delta * x) for x in range(1, n_dates_split + 1)
-    ]
-    return list_recalibrated_splits[idx - 1]
+    if len(list_df) == 1:
+        return df.copy()
+    # add any missing end rows
+    return pd_concat(list_df, axis=0)
 
 
 def _recalibrate_datetime_skeleton(df: DataFrame) -> DataFrame:
@@ -119,68 +103,87 @@ def _recalibrate_datetime_skeleton(df: DataFrame) -> DataFrame:
     Args:
     df (DataFrame): Input dataframe to recalibrate based on "datetime_skeleton" and "within_tolerance"
     """
-    df_recal = df.copy()
-    df_recal.sort_values(by="datetime_skeleton", inplace=True)
-    idx_within_tolerance = df_recal["within_tolerance"]
-
-    # create columns to indicate last and next available "observed" dates for each row
-    df_recal["datetime_pre"] = np_nan
-    df_recal["datetime_post"] = np_nan
-
-    # force ends (if unavailable) to remain as `datetime_start` and `datetime_end`
-    if df_recal.at[0, "within_tolerance"] is False:
-        df_recal.loc[0, ["datetime_pre", "datetime_post"]] = df_recal.at[
-            0, "datetime_skeleton"
-        ]
-
-    idx_last = len(df_recal) - 1
-    if df_recal.at[idx_last, "within_tolerance"] is False:
-        df_recal.loc[idx_last, ["datetime_pre", "datetime_post"]] = df_recal.at[
-            idx_last, "datetime_skeleton"
-        ]
-
-    # forward fill all NA values in `datetime_pre` with most recent observed date
-    df_recal.loc[idx_within_tolerance, "datetime_pre"] = df_recal.loc[
-        idx_within_tolerance, "datetime_skeleton"
-    ]
-    df_recal["datetime_pre"].ffill(inplace=True)
-
-    # do same process for `datetime_post`
-    df_recal.sort_values(by="datetime_skeleton", ascending=False, inplace=True)
-
-    df_recal.loc[idx_within_tolerance, "datetime_post"] = df_recal.loc[
-        idx_within_tolerance, "datetime_skeleton"
-    ]
-    df_recal["datetime_post"].ffill(inplace=True)
-
-    # sort once more
-    df_recal.sort_values(by="datetime_skeleton", inplace=True)
-
-    # add two columns to indicate num splits (`n_dates_split`) and split index (`idx`)
-    df_recal["idx"] = (
-        df_recal.groupby(by=["datetime_pre", "datetime_post"]).cumcount() + 1
+    df_recal = df.sort_values(by="datetime_skeleton", kind="stable")
+    t = df_recal["datetime_skeleton"].to_numpy(dtype="datetime64[ns]").view("int64")
+    observed = df_recal["within_tolerance"].eq(True).to_numpy()
+
+    # indicate last ("pre") and next ("post") available "observed" dates for each row, forcing ends (if
+    # unavailable) to remain as `datetime_start` and `datetime_end`
+    anchor_pre = observed.copy()
+    anchor_post = observed.copy()
+    unobserved = df_recal["within_tolerance"].eq(False).to_numpy()
+    forced_first, forced_last = unobserved[0], unobserved[-1]
+    anchor_pre[0] |= forced_first
+    anchor_post[-1] |= forced_last
+
+    # forward fill `datetime_pre` with most recent observed date (and backward fill `datetime_post`)
+    t_pre = where(anchor_pre, t, iinfo(int64).min)
+    t_post = where(anchor_post, t, iinfo(int64).max)
+    datetime_pre = maximum.accumulate(t_pre)
+    datetime_post = minimum.accumulate(t_post[::-1])[::-1]
+    if forced_first:
+        datetime_post[0] = t[0]
+    if forced_last:
+        datetime_pre[-1] = t[-1]
+
+    # determine num splits (`n_dates_split`) and split index (`idx`) for rows between observed dates
+    df_split = DataFrame(
+        data={"datetime_pre": datetime_pre, "datetime_post": datetime_post}
     )
-    df_recal.loc[
-        df_recal["datetime_post"] == df_recal["datetime_pre"], "idx"
-    ] = 0  # change idx to 0 for matched rows
-    df_recal["n_dates_split"] = df_recal.groupby(by=["datetime_pre", "datetime_post"])[
-        "idx"
-    ].transform("max")
-    df_recal["datetime_skeleton"] = df_recal.apply(
-        lambda row: row["datetime_skeleton"]
-        if row["idx"] == 0
-        else _recalibrate_date_split(
-            row["datetime_pre"],
-            row["datetime_post"],
-            row["n_dates_split"],
-            row["idx"],
-        ),
-        axis=1,
+    groups = df_split.groupby(by=["datetime_pre", "datetime_post"], sort=False)
+    idx = groups.cumcount().to_numpy() + 1
+    n_dates_split = groups["datetime_pre"].transform("size").to_numpy()
+
+    # evenly split each date range, leaving matched rows (where pre and post are the same) unchanged
+    datetime_delta = (datetime_post - datetime_pre) / (n_dates_split + 1)
+    datetime_delta = datetime_delta.astype(int64)  # truncate to whole nanoseconds
+    matched = datetime_post == datetime_pre
+    t_recal = where(matched, t, datetime_pre + (datetime_delta * idx))
+
+    df_recal["datetime_skeleton"] = t_recal.view("datetime64[ns]")
+    return df_recal
+
+
+def _build_df_skeleton(
+    df_true: DataFrame,
+    datetime_start: datetime,
+    datetime_end: datetime,
+    temporal_resolution_min: timedelta,
+    col_datetime: str,
+    col_value: str,
+    tolerance_alpha: float,
+) -> DataFrame:
+    """Matches observed data to proposed datetimes (the steps of `get_df_skeleton()` that precede recalibration)."""
+    df = df_true.copy()
+    df_proposed = _create_df_proposed(
+        datetime_start, datetime_end, temporal_resolution_min
     )
-    df_recal.drop(
-        columns=["datetime_pre", "datetime_post", "n_dates_split", "idx"], inplace=True
+
+    # do fuzzy match on `col_datetime` based on temporal resolution
+    df_merged = merge_asof(
+        df_proposed,
+        df[[col_datetime, col_value]],
+        left_on="datetime_proposed",
+        right_on=col_datetime,
+        tolerance=Timedelta(temporal_resolution_min * tolerance_alpha),
+        direction="nearest",
+    )
+    # ensure no values matched twice (happens if date falls along halfway point)
+    df_merged = _maybe_fix_duplicate_matches(
+        df_merged, col_datetime=col_datetime, col_value=col_value
     )
-    return df_recal
+
+    df_full = _add_missing_rows(
+        df,
+        df_merged,
+        col_datetime,
+        col_value,
+        temporal_resolution_min,
+        tolerance_alpha,
+        datetime_start,
+        datetime_end,
+    )
+    return _map_observed_datetimes(df_full, col_value, col_datetime)
 
 
 def get_df_skeleton(
@@ -215,37 +218,15 @@ def get_df_skeleton(
         DataFrame: With "datetime_skeleton" column (contains the proposed time series dates) and "within_tolerance"
         column (contains boolean values indicating whether an observed value was available for a given time point).
     """
-
-    df = df_true.copy()
-    df_proposed = _create_df_proposed(
-        datetime_start, datetime_end, temporal_resolution_min
-    )
-
-    # do fuzzy match on `col_datetime` based on temporal resolution
-    df_merged = merge_asof(
-        df_proposed,
-        df[[col_datetime, col_value]],
-        left_on="datetime_proposed",
-        right_on=col_datetime,
-        tolerance=Timedelta(temporal_resolution_min * tolerance_alpha),
-        direction="nearest",
-    )
-    # ensure no values matched twice (happens if date falls along halfway point)
-    df_merged = _maybe_fix_duplicate_matches(
-        df_merged, col_datetime=col_datetime, col_value=col_value
-    )
-
-    df_full = _add_missing_rows(
-        df,
-        df_merged,
+    df_describe = _build_df_skeleton(
+        df_true,
+        datetime_start,
+        datetime_end,
+        temporal_resolution_min,
         col_datetime,
         col_value,
-        temporal_resolution_min,
         tolerance_alpha,
-        datetime_start,
-        datetime_end,
     )
-    df_describe = _map_observed_datetimes(df_full, col_value, col_datetime)
     if recalibrate:
         df_describe = _recalibrate_datetime_skeleton(df_describe)
     df_out = _ensure_full_temporal_extent(
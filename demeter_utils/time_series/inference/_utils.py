@@ -1,6 +1,8 @@
 from typing import Callable, Dict
 
+from numpy import float64
 from numpy import nan as np_nan
+from numpy import vectorize
 from pandas import DataFrame, NaT, to_numeric
 from pandas.api.types import is_numeric_dtype
 
@@ -18,11 +20,14 @@ def _maybe_fix_duplicate_matches(
     df_merged: DataFrame, col_datetime: str, col_value: str
 ):
     """If an observed value matched more than once to a "proposed" datetime, undo the later match."""
-    matched_rows = df_merged[col_datetime].notna()
-    duplicated = df_merged.duplicated([col_datetime, col_value], keep="first")
-    if any(duplicated & matched_rows):
-        df_merged.loc[duplicated & matched_rows, col_datetime] = NaT
-        df_merged.loc[duplicated & matched_rows, col_value] = np_nan
+    idx_undo = (
+        df_merged.duplicated([col_datetime, col_value], keep="first")
+        & df_merged[col_datetime].notna()
+    ).to_numpy()
+    # only assign when needed, so that an integer `col_value` is not upcast
+    if idx_undo.any():
+        df_merged.loc[idx_undo, col_datetime] = NaT
+        df_merged.loc[idx_undo, col_value] = np_nan
 
     return df_merged
 
@@ -32,6 +37,7 @@ def populate_fill_in_values(
     infer_function: Callable,
     col_value: str = "sample_value",
     col_datetime: str = "datetime_skeleton",
+    vectorized: bool = False,
 ) -> DataFrame:
     """
     Generate a dataframe with predicted values given `df_skeleton` and `infer_function`.
@@ -44,31 +50,32 @@ def populate_fill_in_values(
 
     Args:
         df_skeleton (`DataFrame`): Output dataframe from "get_df_skeleton" function
-        infer_function (`Callable`): Function that takes a `datetime` value and returns an inferred value of
-        interest for missing values in `df_skeleton`.
+        infer_function (`Callable`): Function that takes a time value (nanoseconds since the Unix epoch if
+        `col_datetime` is a datetime column) and returns an inferred value of interest for missing values in
+        `df_skeleton`. It is called once per missing value unless `vectorized` is True.
+        vectorized (`bool`, optional): If True, `infer_function` is called once with an array of all the missing
+        time values (e.g., scipy splines/interpolators) and must return an array of the same shape. Defaults to False.
 
     Returns:
         DataFrame:  Replaces NaN values in `col_value` column with inferences from `infer_function` arg.
     """
-    df_skeleton_in = df_skeleton.copy()
-
-    if not is_numeric_dtype(df_skeleton_in[col_datetime]):
-        df_skeleton_in["t"] = to_numeric(df_skeleton_in[col_datetime])
-    else:
-        df_skeleton_in["t"] = df_skeleton_in[col_datetime]
-
-    # replace the NaN values in `sample_value` column with values in `inference_value` column
-    df_skeleton_in[col_value] = df_skeleton_in.apply(
-        lambda row: row[col_value]
-        if row["within_tolerance"] is True
-        else infer_function(row["t"]),
-        axis=1,
-    )
-
-    df_skeleton_in.drop(columns=["t"], inplace=True)
+    # replace the values in `col_value` column that are not within tolerance with inferences
+    idx_missing = ~df_skeleton["within_tolerance"].eq(True).to_numpy(dtype=bool)
+    values = df_skeleton[col_value].to_numpy(dtype=float64, copy=True)
+    if idx_missing.any():
+        t = df_skeleton[col_datetime]
+        if not is_numeric_dtype(t):
+            t = to_numeric(t)
+        t_missing = t.to_numpy()[idx_missing]
+        if vectorized:
+            values[idx_missing] = infer_function(t_missing)
+        else:
+            values[idx_missing] = vectorize(infer_function, otypes=[float64])(t_missing)
 
     # Rename "within_tolerance" and filter columns
-    df_skeleton_out = df_skeleton_in.rename(columns={"within_tolerance": "true_data"})[
-        ["true_data", col_datetime, col_value]
-    ]
+    df_skeleton_out = (
+        df_skeleton[["within_tolerance", col_datetime]]
+        .rename(columns={"within_tolerance": "true_data"})
+        .assign(**{col_value: values})
+    )
     return df_skeleton_out
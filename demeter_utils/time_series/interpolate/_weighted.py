@@ -1,45 +1,128 @@
 from datetime import timedelta
 from typing import Dict
 
-from numpy import average, exp, power
-from pandas import DataFrame, Series, Timedelta
+from numpy import argsort, array, asarray, empty, exp, float64
+from numpy import nan as np_nan
+from numpy import ndarray, searchsorted
+from pandas import Categorical, DataFrame, Series, Timedelta
 
 from demeter_utils.time import convert_dt_to_unix
 from demeter_utils.time_series.utils import get_datetime_skeleton_time_series
 
+# upper limit on the size (bins x observations) of the Gaussian kernel matrix held in memory at once in
+# `weighted_moving_average()`; long series are processed in correspondingly smaller blocks of bins
+_KERNEL_BLOCK_MAX_ELEMENTS = 2**20
+
 
 def assign_group_weights(
     groups: Series,
     group_weights: Dict,
 ) -> Series:
-    """Creates a Series containing weights that correspond to the passed group weights."""
-    return groups.map(group_weights)
+    """Creates a Series containing weights that correspond to the passed group weights.
+
+    Groups missing from `group_weights` are assigned NaN.
+    """
+    categories = list(group_weights)
+    weight_lut = array(
+        [group_weights[c] for c in categories] + [np_nan], dtype=float64
+    )  # trailing NaN is selected by the -1 code of missing groups
+    codes = Categorical(groups, categories=categories).codes
+    return Series(weight_lut[codes], index=groups.index)
 
 
 def _gaussian(x, mu, sig):
     """Gaussian probability density function with mean `mu` and standard deviation `sig`."""
-    return exp(-power(x - mu, 2.0) / (2 * power(sig, 2.0)))
+    diff = x - mu
+    return exp(-(diff * diff) / (2 * sig * sig))
 
 
 def _gaussian_kernel(
-    t_unix: Series,
+    t_unix: ndarray,
     t_mean: float,
     t_sigma: float,
-) -> Series:
+) -> ndarray:
     """
     Calculate the moving window weights for the passed unix time series based on a Gaussian kernel with
     mean `t_mu` and standard deviation `t_simga`.
 
     Args:
-        t_unix (Series): The input unix time series for which to apply the gaussian kernel.
+        t_unix (ndarray): The input unix time series for which to apply the gaussian kernel.
         t_mean (int): The center of the gaussian distribution.
         t_sigma (float): The standard deviation of the gaussian distribution.
 
     Returns:
-        Series: The moving window distance-based weights.
+        ndarray: The moving window distance-based weights.
+    """
+    return _gaussian(t_unix, mu=t_mean, sig=t_sigma)
+
+
+def _kernel_weighted_mean(
+    bins: ndarray, t_unix: ndarray, y: ndarray, weights: ndarray, t_sigma: float
+) -> ndarray:
+    """
+    Calculate the Gaussian kernel weighted mean of `y` at each of `bins`, considering every observation.
+
+    Bins are processed in blocks so each (bins x observations) kernel matrix stays bounded in size.
     """
-    gaussian_wts = t_unix.apply(lambda t: _gaussian(t, mu=t_mean, sig=t_sigma))
-    return Series(gaussian_wts)
+    weighted_mean = empty(len(bins), dtype=float64)
+    block_size = max(1, _KERNEL_BLOCK_MAX_ELEMENTS // max(1, len(t_unix)))
+    for idx_start in range(0, len(bins), block_size):
+        idx_end = idx_start + block_size
+        kernel = (
+            _gaussian_kernel(
+                t_unix[None, :], t_mean=bins[idx_start:idx_end, None], t_sigma=t_sigma
+            )
+            * weights
+        )
+        total_wts = kernel.sum(axis=1)
+        if (total_wts == 0).any():
+            raise ZeroDivisionError("Weights sum to zero, can't be normalized")
+        weighted_mean[idx_start:idx_end] = (kernel @ y) / total_wts
+    return weighted_mean
+
+
+def _kernel_weighted_mean_truncated(
+    bins: ndarray,
+    t_unix: ndarray,
+    y: ndarray,
+    weights: ndarray,
+    t_sigma: float,
+    n_sigma: float,
+) -> ndarray:
+    """
+    Calculate the Gaussian kernel weighted mean of `y` at each of `bins`, only considering observations within
+    `n_sigma` standard deviations of each bin.
+
+    Bins whose truncated window has no (non-zero) weight, such as bins in a gap in the time series that is wider
+    than the window, fall back to the full kernel (as in `_kernel_weighted_mean()`).
+    """
+    order = argsort(t_unix, kind="stable")
+    t_sorted, y_sorted, wts_sorted = t_unix[order], y[order], weights[order]
+
+    # index window of observations that fall within the truncated kernel of each bin
+    half_width = n_sigma * t_sigma
+    idx_lo = searchsorted(t_sorted, bins - half_width, side="left")
+    idx_hi = searchsorted(t_sorted, bins + half_width, side="right")
+
+    weighted_mean = empty(len(bins), dtype=float64)
+    for idx_bin, (lo, hi) in enumerate(zip(idx_lo, idx_hi)):
+        kernel = (
+            _gaussian_kernel(t_sorted[lo:hi], t_mean=bins[idx_bin], t_sigma=t_sigma)
+            * wts_sorted[lo:hi]
+        )
+        total_wts = kernel.sum()
+        if total_wts == 0 and hi - lo < len(t_sorted):
+            # nothing (weighted) within the truncated window; use the full kernel for this bin
+            lo, hi = 0, len(t_sorted)
+            kernel = (
+                _gaussian_kernel(t_sorted, t_mean=bins[idx_bin], t_sigma=t_sigma)
+                * wts_sorted
+            )
+            total_wts = kernel.sum()
+        if total_wts == 0:
+            raise ZeroDivisionError("Weights sum to zero, can't be normalized")
+        weighted_mean[idx_bin] = (kernel @ y_sorted[lo:hi]) / total_wts
+    return weighted_mean
 
 
 def weighted_moving_average(
@@ -51,6 +134,7 @@ def weighted_moving_average(
     include_bounds: bool = False,
     col_datetime: str = "date",
     col_value: str = "ndvi",
+    kernel_truncation: float = None,
 ) -> Series:
     """
     Calculates a weighted moving average of the passed values for a given step size and window size.
@@ -70,6 +154,12 @@ def weighted_moving_average(
 
         weights (Series): Input weights for each value of `y`; defaults to array of 1s of len(`y`).
 
+        kernel_truncation (float, optional): If set, observations further than `kernel_truncation` standard
+            deviations of the Gaussian kernel (e.g., 3) from a given value of `t_hat` are ignored, which is much
+            faster for long time series. Any bin with no observations within that distance (e.g., in a gap in the
+            time series) falls back to the full kernel. Defaults to None (i.e., all observations contribute to every
+            bin).
+
     Returns:
         Dataframe: Dataframe containing weighted moving average time series for input dataset with columns
             "t" and "y" for the temporal and value components, respectively.
@@ -84,22 +174,22 @@ def weighted_moving_average(
     bins_unix = convert_dt_to_unix(bins_dt, relative_epoch=t.min())
 
     # convert everything to unix
-    t_unix = convert_dt_to_unix(t, relative_epoch=t.min())
+    t_unix = convert_dt_to_unix(t, relative_epoch=t.min()).to_numpy(dtype=float64)
     window_size_unix = window_size // Timedelta("1s")
 
-    # The following line performs these steps at each value of `t_hat` in `bins_unix`:
+    # The following steps are performed at each value of `t_hat` in `bins_unix`:
     # 1. Calculates moving window weights for `y` values based on distance between measured timepoint and `t_hat` given a Gaussian kernel.
     # 2. Multiplies each valueo of `weights` by the corresponding distance-based weight from (1) to calculate full contributing weight of each data point.
     # 3. Calculates the weighted average at `t_hat`.
-
-    weighted_mean = bins_unix.apply(
-        lambda mu: average(
-            y.values,
-            weights=_gaussian_kernel(
-                t_unix, t_mean=mu, t_sigma=window_size_unix / 2
-            ).values
-            * weights,
+    bins = bins_unix.to_numpy(dtype=float64)
+    y_values = y.to_numpy(dtype=float64)
+    wts = asarray(weights, dtype=float64)
+    t_sigma = window_size_unix / 2
+    if kernel_truncation is None:
+        weighted_mean = _kernel_weighted_mean(bins, t_unix, y_values, wts, t_sigma)
+    else:
+        weighted_mean = _kernel_weighted_mean_truncated(
+            bins, t_unix, y_values, wts, t_sigma, n_sigma=kernel_truncation
         )
-    )
 
     return DataFrame(data={col_datetime: bins_dt, col_value: weighted_mean})
@@ -1,7 +1,7 @@
 from datetime import datetime, timedelta
 
 from numpy import ceil as np_ceil
-from pandas import Series
+from pandas import Series, date_range
 
 
 def get_datetime_skeleton_time_series(
@@ -19,10 +19,12 @@ def get_datetime_skeleton_time_series(
     """
     timerange = end - start
     num_steps = np_ceil(timerange / step_size)
-    bin_centers = [start + (step_size * idx) for idx in range(int(num_steps))]
+    bin_centers = Series(
+        date_range(start=start, periods=int(num_steps), freq=step_size)
+    )
 
     if include_bounds:
-        bin_centers[0] = start
-        bin_centers[-1] = end
+        bin_centers.iloc[0] = start
+        bin_centers.iloc[-1] = end
 
-    return Series(bin_centers)
+    return bin_centers
@@ -1,3 +1,3 @@
-from demeter_utils.update._details import update_details
+from demeter_utils.update._details import update_details, update_details_bulk
 
-__all__ = ["update_details"]
+__all__ = ["update_details", "update_details_bulk"]
@@ -1,8 +1,8 @@
-from json import dumps
+from typing import Iterable, Tuple
 
 from demeter.db import Table, TableId
-from psycopg2.extensions import AsIs
-from psycopg2.extras import NamedTupleCursor
+from psycopg2.extras import Json, NamedTupleCursor, execute_values
+from psycopg2.sql import SQL, Identifier
 
 from demeter_utils.query import camel_to_snake
 
@@ -13,16 +13,44 @@ def update_details(
     """Updates the details jsonb data for the given table_id in the given demeter_table."""
     table_name = camel_to_snake(demeter_table.__name__)
     table_name_id = table_name + "_id"
-    # Update details
-    stmt = """
-    update %(table)s
-    set details = '%(details)s'::jsonb
-    WHERE %(table_name_id)s = %(table_id)s;
+    # Update details (only identifiers are composed into the statement; values are bound parameters)
+    stmt = SQL(
+        """
+    update {table}
+    set details = %(details)s::jsonb
+    WHERE {table_name_id} = %(table_id)s;
     """
-    args = {
-        "table": AsIs(table_name),
-        "details": AsIs(dumps(details)),
-        "table_name_id": AsIs(table_name_id),
-        "table_id": AsIs(table_id),
-    }
+    ).format(table=Identifier(table_name), table_name_id=Identifier(table_name_id))
+    # `int()` so that numpy integer IDs (e.g., from a DataFrame) can be adapted by psycopg2
+    args = {"details": Json(details), "table_id": int(table_id)}
     cursor.execute(stmt, vars=args)
+
+
+def update_details_bulk(
+    cursor: NamedTupleCursor,
+    demeter_table: Table,
+    id_details_pairs: Iterable[Tuple[TableId, dict]],
+    page_size: int = 1000,
+):
+    """Updates the details jsonb data for many table_ids in the given demeter_table, `page_size` rows per statement.
+
+    Args:
+        cursor (NamedTupleCursor): Connection cursor.
+        demeter_table (Table): Demeter table to update.
+        id_details_pairs (Iterable[Tuple[TableId, dict]]): `(table_id, details)` pairs to update.
+        page_size (int, optional): Maximum number of rows updated per round trip. Defaults to 1000.
+    """
+    table_name = camel_to_snake(demeter_table.__name__)
+    table_name_id = table_name + "_id"
+    stmt = SQL(
+        """
+    update {table} AS t
+    set details = v.details::jsonb
+    FROM (VALUES %s) AS v(table_id, details)
+    WHERE t.{table_name_id} = v.table_id;
+    """
+    ).format(table=Identifier(table_name), table_name_id=Identifier(table_name_id))
+    argslist = [
+        (int(table_id), Json(details)) for table_id, details in id_details_pairs
+    ]
+    execute_values(cursor, stmt, argslist, template="(%s, %s)", page_size=page_size)
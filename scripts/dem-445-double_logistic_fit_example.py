@@ -1,21 +1,27 @@
 # %% Imports
 from datetime import datetime, timedelta
 from functools import partial
-from io import StringIO
+from os import replace
+from pathlib import Path
+from tempfile import NamedTemporaryFile, gettempdir
 
 import matplotlib.pyplot as plt
 import requests
-from pandas import DataFrame, date_range, read_csv, to_datetime
-from scipy.optimize import minimize
+from numpy import float64
+from pandas import DataFrame, Timedelta, date_range, read_csv
+from scipy.optimize import least_squares
 
 from demeter_utils.time import convert_dt_to_unix
 from demeter_utils.time_series.inference import TimeSeriesFitter
 from demeter_utils.time_series.inference._double_logistic import (
+    _double_logistic_jacobian,
+    _double_logistic_residuals,
     approximate_inflection_with_cubic_poly,
     double_logistic,
 )
 
 # %% Get data
+GIMMS_URL = "https://glam1.gsfc.nasa.gov/api/gettbl/v4?sat=MOD&version=v11&layer=NDVI&mask=NASS_2011-2016_corn&shape=ADM&ids=110955&ts_type=seasonal&years=2022&start_month=1&num_months=12&format=csv"
 GIMMS_COLS = {
     "START DATE": "date_start",
     "END DATE": "date_end",
@@ -25,25 +31,42 @@ GIMMS_COLS = {
     "MIN VALUE": "min_hist_value",
     "MAX VALUE": "max_hist_value",
 }
-req = requests.get(
-    "https://glam1.gsfc.nasa.gov/api/gettbl/v4?sat=MOD&version=v11&layer=NDVI&mask=NASS_2011-2016_corn&shape=ADM&ids=110955&ts_type=seasonal&years=2022&start_month=1&num_months=12&format=csv"
-)
-text = StringIO(req.content.decode("utf-8"))
-df_gimms_ndvi = read_csv(text, skiprows=14).rename(columns=GIMMS_COLS)[
-    GIMMS_COLS.values()
-]
+# the CSV is kept in the temp directory for later runs; it is downloaded to a ".part" file that is only moved into
+# place once complete, so an interrupted download is never reused
+gimms_csv = Path(gettempdir()) / "gimms_ndvi_110955_2022.csv"
+if not gimms_csv.exists():
+    f_part = NamedTemporaryFile(
+        dir=gimms_csv.parent, prefix=gimms_csv.name, suffix=".part", delete=False
+    )
+    try:
+        with f_part, requests.get(GIMMS_URL, stream=True) as req:
+            req.raise_for_status()
+            for chunk in req.iter_content(chunk_size=2**16):
+                f_part.write(chunk)
+        replace(f_part.name, gimms_csv)
+    except BaseException:
+        Path(f_part.name).unlink(missing_ok=True)
+        raise
+
+df_gimms_ndvi = read_csv(
+    gimms_csv,
+    skiprows=14,
+    usecols=list(GIMMS_COLS),
+    parse_dates=["START DATE", "END DATE"],
+).rename(columns=GIMMS_COLS)
 
 # %% Clean data for function
 col_datetime = "date_start"
 col_value = "sample_value"
 col_unix = "t_unix"
 col_t = "t"
-year = 2022
 
-df = df_gimms_ndvi.loc[df_gimms_ndvi[col_value].notna()]
-df[col_datetime] = to_datetime(df[col_datetime])
-df.sort_values(by=[col_datetime], inplace=True)
-df.reset_index(drop=True, inplace=True)
+# observed values only, in chronological order
+df = (
+    df_gimms_ndvi.loc[df_gimms_ndvi[col_value].notna()]
+    .sort_values(by=[col_datetime])
+    .reset_index(drop=True)
+)
 
 # %% Fit double logistic function
 ## TODO: When making this into a function, we need the following additions:
@@ -53,7 +76,6 @@ df.reset_index(drop=True, inplace=True)
 # - Add an assertion step that checks for appropriate data availability
 
 # Input parameters
-df_in = df.copy()
 col_datetime = col_datetime
 col_value = col_value
 
@@ -62,34 +84,35 @@ col_unix = "t_unix"
 col_t = "t"
 
 # %% Transform and standardize temporal dimension to improve convergence
-date_min = df_in[col_datetime].min()
-df_in[col_unix] = df_in[col_datetime].map(
-    lambda dt: convert_dt_to_unix(dt, relative_epoch=date_min)
-)
+date_min = df[col_datetime].min()
+df[col_unix] = (df[col_datetime] - date_min) // Timedelta("1s")
 
 # standardize to reduce scale (mean = 0, sd = 1)
-t_mean = df_in[col_unix].mean()
-t_sd = df_in[col_unix].std()
+t_mean = df[col_unix].mean()
+t_sd = df[col_unix].std()
 
 
 def dt_transformation(dt: datetime) -> float:
+    # works on a single `datetime` or on a whole Series/DatetimeIndex at once
     unix = convert_dt_to_unix(dt, relative_epoch=date_min)  # convert to psuedo-unix
     return (unix - t_mean) / t_sd  # scale
 
 
-df_in[col_t] = df_in[col_datetime].map(lambda dt: dt_transformation(dt))
+df[col_t] = (df[col_unix] - t_mean) / t_sd
 
 # %% Estimate initial values of parameters based on time series
-ymax = df_in[col_value].max()
-ymin = df_in[col_value].min()
+ymax = df[col_value].max()
+ymin = df[col_value].min()
 
 # determine left and right side of curve
 max_threshold = 0.1
 max_bound = ymax * (1 - max_threshold)
-ind_max = df_in.loc[df_in[col_value] >= max_bound].index.values
+near_max = df[col_value].to_numpy() >= max_bound
+idx_first_max = near_max.argmax()
+idx_last_max = len(near_max) - 1 - near_max[::-1].argmax()
 
-df_left = df_in.iloc[: min(ind_max) + 1, :]
-df_right = df_in.iloc[max(ind_max) :, :]
+df_left = df.iloc[: idx_first_max + 1, :]
+df_right = df.iloc[idx_last_max:, :]
 
 left_params = approximate_inflection_with_cubic_poly(
     t=df_left[col_t],
@@ -106,8 +129,8 @@ right_params = approximate_inflection_with_cubic_poly(
 )
 
 # %% Fit double logistic
-t = df_in[col_t].astype(float)
-y = df_in[col_value].astype(float)
+t = df[col_t].to_numpy(dtype=float64)
+y = df[col_value].to_numpy(dtype=float64)
 
 guess = {
     "ymin": ymin,
@@ -120,23 +143,15 @@ guess = {
 guess_values = [*guess.values()]
 
 
-def _cost_function(p, t, y):
-    partial_fx = partial(
-        double_logistic,
-        ymin=p[0],
-        ymax=p[1],
-        t_incr=p[2],
-        t_decr=p[3],
-        rate_incr=p[4],
-        rate_decr=p[5],
-    )
-    y_pred = partial_fx(t)
-    se = (y_pred - y) ** 2
-    return se.sum()
-
-
-# minimize cost function with initial values
-opt = minimize(_cost_function, guess_values, args=(t, y))
+# fit by least squares with the analytic Jacobian
+opt = least_squares(
+    _double_logistic_residuals,
+    guess_values,
+    jac=_double_logistic_jacobian,
+    args=(t, y),
+    method="trf",
+    x_scale="jac",
+)
 popt = opt.x
 pars = {
     "ymin": popt[0],
@@ -149,28 +164,29 @@ pars = {
 
 
 # create partial function that takes `datetime`, transforms it appropriately, and estimates value
-def fitted_double_logistic(dt: datetime) -> float:
-    partial_fx = partial(
-        double_logistic,
-        ymin=pars["ymin"],
-        ymax=pars["ymax"],
-        t_incr=pars["t_incr"],
-        t_decr=pars["t_decr"],
-        rate_incr=pars["rate_incr"],
-        rate_decr=pars["rate_decr"],
-    )
+fitted_double_logistic_fx = partial(
+    double_logistic,
+    ymin=pars["ymin"],
+    ymax=pars["ymax"],
+    t_incr=pars["t_incr"],
+    t_decr=pars["t_decr"],
+    rate_incr=pars["rate_incr"],
+    rate_decr=pars["rate_decr"],
+)
+
 
+def fitted_double_logistic(dt: datetime) -> float:
     t = dt_transformation(dt)
-    return partial_fx(t)
+    return fitted_double_logistic_fx(t)
 
 
 # %% Plot
 dt_fit = date_range(
-    start=df_in[col_datetime].min(), end=df_in[col_datetime].max(), periods=100
+    start=df[col_datetime].min(), end=df[col_datetime].max(), periods=100
 )
 df_fit = DataFrame(data={"t": dt_fit, "value": fitted_double_logistic(dt=dt_fit)})
 
-plt.scatter(df_in[col_datetime], df_in[col_value], c="black")
+plt.scatter(df[col_datetime], df[col_value], c="black")
 plt.plot(df_fit["t"], df_fit["value"])
 
 plt.legend()
@@ -244,6 +260,7 @@ plt.show()
 # plt.show()
 # %% Use TimeSeriesFitter
 
+df_ndvi = df.copy()
 df = df_gimms_ndvi.loc[df_gimms_ndvi[col_value].notna()]
 step_size = timedelta(days=14)
 window_size = timedelta(days=5)
@@ -251,7 +268,6 @@ wt_mapping = {"drone": 100, "satellite": 1}
 col_datetime = "date_start"
 col_value = "sample_value"
 field_id = "my_field_id"
-df_ndvi = df_in.copy()
 
 fitter = TimeSeriesFitter(
     df=df_ndvi.loc[df_ndvi["field_id"] == field_id],
@@ -1,6 +1,8 @@
 # %% Imports
 from datetime import datetime, timedelta
-from io import StringIO
+from os import replace
+from pathlib import Path
+from tempfile import NamedTemporaryFile, gettempdir
 from typing import Callable
 
 import matplotlib.pyplot as plt
@@ -8,11 +10,14 @@ import requests
 from numpy import ceil
 from pandas import DataFrame
 from pandas import concat as pd_concat
-from pandas import read_csv, to_datetime
+from pandas import date_range, read_csv
 from scipy.interpolate import UnivariateSpline
 
 from demeter_utils.time import convert_dt_to_unix
-from demeter_utils.time_series.interpolate import weighted_moving_average
+from demeter_utils.time_series.interpolate import (
+    assign_group_weights,
+    weighted_moving_average,
+)
 
 
 # %% Visualization function
@@ -30,17 +35,18 @@ def _plot_ndvi_fx(df: DataFrame, df_line: DataFrame, pipeline: Callable):
     """
     # get x values for plotting at daily resolution
     num_steps = int(ceil((df_line["t"].max() - df_line["t"].min()) / timedelta(days=1)))
-    x = [df_line["t"].min() + (idx * timedelta(days=1)) for idx in range(num_steps + 1)]
+    x = date_range(start=df_line["t"].min(), periods=num_steps + 1, freq="1D")
     y = pipeline(x)
-    df_fit = DataFrame(data={"x": x, "y": y})
 
     # create plot
     colors = {"drone": "black", "GIMMS": "green", "Sentinel-2": "red"}
     fig = plt.figure()
 
+    # plot each source in `colors` order
+    df_by_source = dict(tuple(df.groupby("source", sort=False)))
     for label in colors.keys():
-        df_color_subset = df.loc[df["source"] == label]
-        if len(df_color_subset) > 0:
+        df_color_subset = df_by_source.get(label)
+        if df_color_subset is not None:
             plt.scatter(
                 df_color_subset["date_observed"],
                 df_color_subset["value_observed"],
@@ -48,9 +54,7 @@ def _plot_ndvi_fx(df: DataFrame, df_line: DataFrame, pipeline: Callable):
                 label=label,
             )
     plt.xticks(rotation=60)
-    plt.plot(
-        df_fit["x"].to_list(), df_fit["y"].to_list(), c="red", label="fitted NDVI curve"
-    )
+    plt.plot(x, y, c="red", label="fitted NDVI curve")
     plt.legend()
 
     return fig
@@ -61,6 +65,7 @@ def _plot_ndvi_fx(df: DataFrame, df_line: DataFrame, pipeline: Callable):
 col_dt = "date_observed"
 col_value = "value_observed"
 
+GIMMS_URL = "https://glam1.gsfc.nasa.gov/api/gettbl/v4?sat=MOD&version=v11&layer=NDVI&mask=NASS_2011-2016_corn&shape=ADM&ids=110955&ts_type=seasonal&years=2022&start_month=1&num_months=12&format=csv"
 GIMMS_COLS = {
     "START DATE": "date_start",
     "END DATE": "date_end",
@@ -70,18 +75,35 @@ GIMMS_COLS = {
     "MIN VALUE": "min_hist_value",
     "MAX VALUE": "max_hist_value",
 }
-req = requests.get(
-    "https://glam1.gsfc.nasa.gov/api/gettbl/v4?sat=MOD&version=v11&layer=NDVI&mask=NASS_2011-2016_corn&shape=ADM&ids=110955&ts_type=seasonal&years=2022&start_month=1&num_months=12&format=csv"
-)
-text = StringIO(req.content.decode("utf-8"))
-df_gimms_ndvi = read_csv(text, skiprows=14).rename(columns=GIMMS_COLS)[
-    GIMMS_COLS.values()
-]
+# the CSV is kept in the temp directory for later runs; it is downloaded to a ".part" file that is only moved into
+# place once complete, so an interrupted download is never reused
+gimms_csv = Path(gettempdir()) / "gimms_ndvi_110955_2022.csv"
+if not gimms_csv.exists():
+    f_part = NamedTemporaryFile(
+        dir=gimms_csv.parent, prefix=gimms_csv.name, suffix=".part", delete=False
+    )
+    try:
+        with f_part, requests.get(GIMMS_URL, stream=True) as req:
+            req.raise_for_status()
+            for chunk in req.iter_content(chunk_size=2**16):
+                f_part.write(chunk)
+        replace(f_part.name, gimms_csv)
+    except BaseException:
+        Path(f_part.name).unlink(missing_ok=True)
+        raise
+
+df_gimms_ndvi = read_csv(
+    gimms_csv,
+    skiprows=14,
+    usecols=list(GIMMS_COLS),
+    parse_dates=["START DATE", "END DATE"],
+).rename(columns=GIMMS_COLS)
 df_gimms_clean = df_gimms_ndvi.rename(
     columns={"date_start": col_dt, "sample_value": col_value}
 ).dropna(subset=[col_value], axis=0)
-df_gimms_clean[col_dt] = to_datetime(df_gimms_clean[col_dt])
 df_gimms_clean.insert(0, "source", "GIMMS")
+# GIMMS columns combined with each example's data
+df_gimms_example = df_gimms_clean[["source", col_dt, col_value]]
 
 
 # %% Example 1: Made up data
@@ -99,15 +121,13 @@ df_test = DataFrame(
         col_value: values,
     }
 )
-df = pd_concat([df_gimms_clean[df_test.columns], df_test], axis=0).sort_values(
-    by=col_dt
-)
+df = pd_concat([df_gimms_example, df_test], axis=0).sort_values(by=col_dt)
 
 step_size = timedelta(days=14)
 window_size = timedelta(days=10)
 group_weights = {"GIMMS": 0.05, "drone": 1.0}
 col_group = "source"
-wts = df[col_group].map(group_weights)
+wts = assign_group_weights(df[col_group], group_weights)
 
 # get weighted moving average
 df_line = weighted_moving_average(
@@ -117,7 +137,8 @@ df_line = weighted_moving_average(
     window_size=window_size,
     weights=wts,
 )
-xt = convert_dt_to_unix(df_line["t"], relative_epoch=df_line["t"].min())
+t_epoch = df_line["t"].min()
+xt = convert_dt_to_unix(df_line["t"], relative_epoch=t_epoch)
 
 # fit univariate smoothing spline to weighted mean curves
 # `s` represents smoothing factor (i.e., upper limit for sum of squared errors), let's use 5% of mean value
@@ -125,7 +146,7 @@ fx = UnivariateSpline(x=xt, y=df_line["y"], s=df[col_value].mean() * 0.05)
 
 
 def pipeline(dt) -> float:
-    t = convert_dt_to_unix(dt, relative_epoch=df_line["t"].min())
+    t = convert_dt_to_unix(dt, relative_epoch=t_epoch)
     return fx(t)
 
 
@@ -135,20 +156,20 @@ fig.show()
 
 # %% Example 2: Loaded data
 df_true = read_csv(
-    "/Users/marissakivi/Desktop/df_drone_imagery1.csv", parse_dates=[col_dt]
+    "/Users/marissakivi/Desktop/df_drone_imagery1.csv",
+    parse_dates=[col_dt],
 )
-df_true["date_observed"] = to_datetime(df_true["date_observed"])
 df_true.insert(0, "source", "drone")
 
-df = pd_concat(
-    [df_gimms_clean[df_test.columns], df_true[df_test.columns]], axis=0
-).sort_values(by=col_dt)
+df = pd_concat([df_gimms_example, df_true[df_test.columns]], axis=0).sort_values(
+    by=col_dt
+)
 
 step_size = timedelta(days=14)
 window_size = timedelta(days=10)
 group_weights = {"GIMMS": 0.05, "drone": 1.0}
 col_group = "source"
-wts = df[col_group].map(group_weights)
+wts = assign_group_weights(df[col_group], group_weights)
 
 # get weighted moving average
 df_line = weighted_moving_average(
@@ -158,7 +179,8 @@ df_line = weighted_moving_average(
     window_size=window_size,
     weights=wts,
 )
-xt = convert_dt_to_unix(df_line["t"], relative_epoch=df_line["t"].min())
+t_epoch = df_line["t"].min()
+xt = convert_dt_to_unix(df_line["t"], relative_epoch=t_epoch)
 
 # fit univariate smoothing spline to weighted mean curves
 # `s` represents smoothing factor (i.e., upper limit for sum of squared errors), let's use 5% of mean value
@@ -166,7 +188,7 @@ fx = UnivariateSpline(x=xt, y=df_line["y"], s=df[col_value].mean() * 0.05)
 
 
 def pipeline(dt) -> float:
-    t = convert_dt_to_unix(dt, relative_epoch=df_line["t"].min())
+    t = convert_dt_to_unix(dt, relative_epoch=t_epoch)
     return fx(t)
 
 
@@ -182,15 +204,13 @@ values = [0.73, 0.54]
 df_test = DataFrame(data={col_dt: dates, col_value: values})
 df_test.insert(0, "source", "drone")
 
-df = pd_concat([df_gimms_clean[df_test.columns], df_test], axis=0).sort_values(
-    by=col_dt
-)
+df = pd_concat([df_gimms_example, df_test], axis=0).sort_values(by=col_dt)
 
 step_size = timedelta(days=14)
 window_size = timedelta(days=10)
 group_weights = {"GIMMS": 0.05, "drone": 1.0}
 col_group = "source"
-wts = df[col_group].map(group_weights)
+wts = assign_group_weights(df[col_group], group_weights)
 
 # get weighted moving average
 df_line = weighted_moving_average(
@@ -200,7 +220,8 @@ df_line = weighted_moving_average(
     window_size=window_size,
     weights=wts,
 )
-xt = convert_dt_to_unix(df_line["t"], relative_epoch=df_line["t"].min())
+t_epoch = df_line["t"].min()
+xt = convert_dt_to_unix(df_line["t"], relative_epoch=t_epoch)
 
 # fit univariate smoothing spline to weighted mean curves
 # `s` represents smoothing factor (i.e., upper limit for sum of squared errors), let's use 5% of mean value
@@ -208,7 +229,7 @@ fx = UnivariateSpline(x=xt, y=df_line["y"], s=df[col_value].mean() * 0.05)
 
 
 def pipeline(dt) -> float:
-    t = convert_dt_to_unix(dt, relative_epoch=df_line["t"].min())
+    t = convert_dt_to_unix(dt, relative_epoch=t_epoch)
     return fx(t)
 
 
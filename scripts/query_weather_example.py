@@ -93,8 +93,7 @@ include_metadata = False
 
 with catchtime() as t:
     gdf_sql = query_daily_weather(
-        conn=conn,
-        # cursor=cursor,
+        cursor=cursor,
         coordinate_list=coordinate_list,
         startdate=startdate,
         enddate=enddate,
@@ -2,125 +2,111 @@
 from datetime import datetime, timedelta
 
 import matplotlib.pyplot as plt
-from pandas import DataFrame
+from numpy import full, ndarray, where
+from pandas import DataFrame, DatetimeIndex
 
 from demeter_utils.time_series.inference import get_df_skeleton
 
 
 # %% psuedo-inference function
-def fx(dt: datetime) -> float:
-    day = dt.day
+def fx(dates: DatetimeIndex) -> ndarray:
+    day = dates.day.to_numpy()
     return (1 / 200) * (day - 31) * (-day - 1)
 
 
 colors = {True: "blue", False: "red"}
-ends = [datetime(2022, 1, 1), datetime(2022, 1, 31)]
+datetime_start, datetime_end = datetime(2022, 1, 1), datetime(2022, 1, 31)
 
 
 def plot_and_compare(df_test: DataFrame):
     df = get_df_skeleton(
         df_true=df_test,
-        datetime_start=ends[0],
-        datetime_end=ends[1],
+        datetime_start=datetime_start,
+        datetime_end=datetime_end,
         col_datetime="date",
         col_value="value",
         temporal_resolution_min=timedelta(days=2),
         tolerance_alpha=0.5,
         recalibrate=True,
     )
-    value = [1] * len(df)
+    value = full(len(df), 1)
 
     df_recalibrate = get_df_skeleton(
         df_true=df_test,
-        datetime_start=ends[0],
-        datetime_end=ends[1],
+        datetime_start=datetime_start,
+        datetime_end=datetime_end,
         col_datetime="date",
         col_value="value",
         temporal_resolution_min=timedelta(days=2),
         tolerance_alpha=0.5,
         recalibrate=False,
     )
-    value_recalibrate = [2] * len(df_recalibrate)
-    plt.scatter(df["datetime_skeleton"], value, c=df["within_tolerance"].map(colors))
-    plt.scatter(
-        df_recalibrate["datetime_skeleton"],
-        value_recalibrate,
-        c=df["within_tolerance"].map(colors),
+    value_recalibrate = full(len(df_recalibrate), 2)
+    point_colors = where(
+        df["within_tolerance"].eq(True).to_numpy(), colors[True], colors[False]
     )
-    plt.axvline(x=ends[0], c="black")
-    plt.axvline(x=ends[1], c="black")
-    plt.ylim(0, 3)
-    plt.xticks(rotation=60)
+    fig, ax = plt.subplots()
+    ax.scatter(df["datetime_skeleton"], value, c=point_colors)
+    ax.scatter(df_recalibrate["datetime_skeleton"], value_recalibrate, c=point_colors)
+    ax.axvline(x=datetime_start, c="black")
+    ax.axvline(x=datetime_end, c="black")
+    ax.set_ylim(0, 3)
+    ax.tick_params(axis="x", labelrotation=60)
     plt.show()
 
 
-# %% test case 1: all dates within range, no observed dates matched on start or end date
-dates = [
-    datetime(2022, 1, 5),
-    datetime(2022, 1, 14),
-    datetime(2022, 1, 20),
-    datetime(2022, 1, 28),
-]
-values = [fx(dt) for dt in dates]
-df_test = DataFrame(data={"date": dates, "value": values})
-
-plot_and_compare(df_test)
-
-# %% test case 2: earliest date before start date and latest date inside date range
-dates = [
-    datetime(2021, 12, 31),
-    datetime(2022, 1, 14),
-    datetime(2022, 1, 20),
-    datetime(2022, 1, 28),
-]
-values = [fx(dt) for dt in dates]
-df_test = DataFrame(data={"date": dates, "value": values})
-
-plot_and_compare(df_test)
-
-# %% test case 3: start date on inside of range
-dates = [
-    datetime(2022, 1, 2),
-    datetime(2022, 1, 14),
-    datetime(2022, 1, 20),
-    datetime(2022, 1, 28),
-]
-values = [fx(dt) for dt in dates]
-df_test = DataFrame(data={"date": dates, "value": values})
-
-plot_and_compare(df_test)
-
-# %% test case 4: start and end date on inside of range
-dates = [
-    datetime(2022, 1, 2),
-    datetime(2022, 1, 14),
-    datetime(2022, 1, 20),
-    datetime(2022, 1, 30),
-]
-values = [fx(dt) for dt in dates]
-df_test = DataFrame(data={"date": dates, "value": values})
-
-plot_and_compare(df_test)
-
-# %% test case 5: start and end date on outside of range
-dates = [
-    datetime(2021, 12, 31),
-    datetime(2022, 1, 14),
-    datetime(2022, 1, 20),
-    datetime(2022, 2, 1),
-]
-values = [fx(dt) for dt in dates]
-df_test = DataFrame(data={"date": dates, "value": values})
-
-plot_and_compare(df_test)
-
-# %% test: only 2 dates, both within datetime_start/end
-dates = [
-    datetime(2022, 1, 14),
-    datetime(2022, 1, 20, 18),
-]
-values = [fx(dt) for dt in dates]
-df_test = DataFrame(data={"date": dates, "value": values})
-
-plot_and_compare(df_test)
+# %% Test cases (observed dates for each)
+TEST_CASES = {
+    "all dates within range, no observed dates matched on start or end date": DatetimeIndex(
+        [
+            datetime(2022, 1, 5),
+            datetime(2022, 1, 14),
+            datetime(2022, 1, 20),
+            datetime(2022, 1, 28),
+        ]
+    ),
+    "earliest date before start date and latest date inside date range": DatetimeIndex(
+        [
+            datetime(2021, 12, 31),
+            datetime(2022, 1, 14),
+            datetime(2022, 1, 20),
+            datetime(2022, 1, 28),
+        ]
+    ),
+    "start date on inside of range": DatetimeIndex(
+        [
+            datetime(2022, 1, 2),
+            datetime(2022, 1, 14),
+            datetime(2022, 1, 20),
+            datetime(2022, 1, 28),
+        ]
+    ),
+    "start and end date on inside of range": DatetimeIndex(
+        [
+            datetime(2022, 1, 2),
+            datetime(2022, 1, 14),
+            datetime(2022, 1, 20),
+            datetime(2022, 1, 30),
+        ]
+    ),
+    "start and end date on outside of range": DatetimeIndex(
+        [
+            datetime(2021, 12, 31),
+            datetime(2022, 1, 14),
+            datetime(2022, 1, 20),
+            datetime(2022, 2, 1),
+        ]
+    ),
+    "only 2 dates, both within datetime_start/end": DatetimeIndex(
+        [
+            datetime(2022, 1, 14),
+            datetime(2022, 1, 20, 18),
+        ]
+    ),
+}
+
+# %% Plot each test case
+for dates in TEST_CASES.values():
+    df_test = DataFrame(data={"date": dates, "value": fx(dates)})
+    plot_and_compare(df_test)
 # %%